@@ -9,6 +9,11 @@ from nlptest.utils.custom_types import Sample
 from nlptest.datahandler.datasource import DataFactory
 from nlptest.transform.utils import create_terminology
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class BaseAugmentaion(ABC):
 
@@ -93,7 +98,7 @@ class AugmentRobustness(BaseAugmentaion):
 
         if isinstance(self.config, str):
             with open(self.config) as fread:
-                self.config = yaml.safe_load(fread)
+                self.config = yaml.load(fread, Loader=SafeLoader)
 
     def fix(
         self,
@@ -1,12 +1,40 @@
+import ast
 import csv
+import functools
+import itertools
 import os
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import pandas as pd
 
 from .format import Formatter
 from ..utils.custom_types import NEROutput, NERPrediction, Sample, SequenceClassificationOutput, SequenceLabel
 
+_DOCSTART_RE = re.compile(r"-DOCSTART- \S+ \S+ O")
+
+
+@functools.lru_cache(maxsize=64)
+def _sniff_delimiter(file_path: str, mtime: float) -> str:
+    """
+    Sniffs the delimiter from the first line of a csv file. Results are cached per path and
+    modification time, so an unchanged file is only sniffed once.
+    Args:
+        file_path (str):
+            location of the csv file to load
+        mtime (float):
+            modification time of the file, only used as part of the cache key
+    Returns:
+        str:
+            delimiter character of the file
+    """
+    sniffer = csv.Sniffer()
+    with open(file_path, encoding="utf-8") as fp:
+        first_line = fp.readline()
+        delimiter = sniffer.sniff(first_line).delimiter
+    return delimiter
+
 
 class _IDataset(ABC):
     """Abstract base class for Dataset.
@@ -39,6 +67,7 @@ class DataFactory:
     The DataFactory class is responsible for creating instances of the
     correct Dataset type based on the file extension.
     """
+    _CLASS_MAP = None
 
     def __init__(
             self,
@@ -52,11 +81,24 @@ class DataFactory:
         """
 
         self._file_path = file_path
-        self._class_map = {cls.__name__.replace('Dataset', '').lower(): cls for cls in _IDataset.__subclasses__()}
+        self._class_map = DataFactory._get_class_map()
         _, self.file_ext = os.path.splitext(self._file_path)
         self.task = task
         self.init_cls = None
 
+    @classmethod
+    def _get_class_map(cls) -> Dict[str, type]:
+        """Mapping from file extension to Dataset class, built once on first use.
+
+        Returns:
+            Dict[str, type]: Dataset classes keyed by the file extension they handle.
+        """
+        if cls._CLASS_MAP is None:
+            cls._CLASS_MAP = {
+                subclass.__name__.replace('Dataset', '').lower(): subclass for subclass in _IDataset.__subclasses__()
+            }
+        return cls._CLASS_MAP
+
     def load(self) -> List[Sample]:
         """Loads the data for the correct Dataset type.
         
@@ -101,48 +143,54 @@ class ConllDataset(_IDataset):
             List[Sample]: List of formatted sentences from the dataset.
         """
         data = []
-        with open(self._file_path) as f:
-            content = f.read()
-            docs_strings = re.findall(r"-DOCSTART- \S+ \S+ O", content.strip())
-            docs = [i.strip() for i in re.split(r"-DOCSTART- \S+ \S+ O", content.strip()) if i != '']
-            for d_id, doc in enumerate(docs):
-                #  file content to sentence split
-                sentences = doc.strip().split('\n\n')
-
-                if sentences == ['']:
-                    data.append(([''], ['']))
-                    continue
-
-                for sent in sentences:
-                    # sentence string to token level split
-                    tokens = sent.strip().split('\n')
-
-                    # get annotations from token level split
-                    token_list = [t.split() for t in tokens]
-
-                    #  get token and labels from the split
-                    ner_labels = []
-                    cursor = 0
-                    for split in token_list:
-                        ner_labels.append(
-                            NERPrediction.from_span(
-                                entity=split[-1],
-                                word=split[0],
-                                start=cursor,
-                                end=cursor + len(split[0]),
-                                doc_id=d_id,
-                                doc_name=(docs_strings[d_id] if len(docs_strings) > 0 else ''),
-                                pos_tag=split[1],
-                                chunk_tag=split[2]
-                            )
+        with open(self._file_path, encoding="utf-8") as f:
+            d_id = 0
+            doc_count = 0
+            doc_name = ''
+            words = []
+            ner_labels = []
+            cursor = 0
+            #   tags repeat a lot across tokens, keep a single str object per distinct tag
+            tags = {}
+            # the trailing empty line flushes the last sentence of the file
+            for line in itertools.chain(f, ['']):
+                docstart = _DOCSTART_RE.match(line)
+                if docstart or not line.strip():
+                    if ner_labels:
+                        data.append(
+                            Sample(original=" ".join(words), expected_results=NEROutput(predictions=ner_labels))
                         )
-                        cursor += len(split[0]) + 1  # +1 to account for the white space
-
-                    original = " ".join([label.span.word for label in ner_labels])
+                        words = []
+                        ner_labels = []
+                        cursor = 0
+                        #   sentences before the first -DOCSTART- form their own document, numbered 0
+                        if doc_count == 0:
+                            doc_count = 1
+
+                    if docstart:
+                        d_id = doc_count
+                        doc_count += 1
+                        doc_name = docstart.group()
+                    continue
 
-                    data.append(
-                        Sample(original=original, expected_results=NEROutput(predictions=ner_labels))
+                #  get token and labels from the split
+                split = line.split()
+                word = split[0]
+                word_len = len(word)
+                words.append(word)
+                ner_labels.append(
+                    NERPrediction.from_span(
+                        entity=tags.setdefault(split[-1], split[-1]),
+                        word=word,
+                        start=cursor,
+                        end=cursor + word_len,
+                        doc_id=d_id,
+                        doc_name=doc_name,
+                        pos_tag=tags.setdefault(split[1], split[1]),
+                        chunk_tag=tags.setdefault(split[2], split[2])
                     )
+                )
+                cursor += word_len + 1  # +1 to account for the white space
 
         return data
 
@@ -156,13 +204,13 @@ class ConllDataset(_IDataset):
                 path to save the data to
         """
         temp_id = None
-        otext = ""
+        otext = []
         for i in data:
             text, temp_id = Formatter.process(i, output_format='conll', temp_id=temp_id)
-            otext += text
+            otext.append(text)
 
-        with open(output_path, "wb") as fwriter:
-            fwriter.write(bytes(otext, encoding="utf-8"))
+        with open(output_path, "w", encoding="utf-8", newline="") as fwriter:
+            fwriter.writelines(otext)
 
 
 class JSONDataset(_IDataset):
@@ -201,15 +249,20 @@ class CSVDataset(_IDataset):
     COLUMN_NAMES = {
         'text-classification': {
             'text': ['text', 'sentences', 'sentence', 'sample'],
-            'label': ['label', 'labels ', 'class', 'classes']
+            'label': ['label', 'labels', 'class', 'classes']
         },
         'ner': {
             'text': ['text', 'sentences', 'sentence', 'sample'],
-            'ner': ['label', 'labels ', 'class', 'classes', 'ner_tag', 'ner_tags', 'ner', 'entity'],
+            'ner': ['label', 'labels', 'class', 'classes', 'ner_tag', 'ner_tags', 'ner', 'entity'],
             'pos': ['pos_tags', 'pos_tag', 'pos', 'part_of_speech'],
             'chunk': ['chunk_tags', 'chunk_tag']
         }
     }
+    ALIAS_TO_KEY = {
+        task: {alias.strip().lower(): key for key, aliases in columns.items() for alias in aliases}
+        for task, columns in COLUMN_NAMES.items()
+    }
+    CHUNK_SIZE = 100_000
 
     def __init__(self, file_path: str, task: str) -> None:
         """Initializes CSVDataset object.
@@ -231,23 +284,26 @@ class CSVDataset(_IDataset):
         Returns:
             List[Sample]: List of formatted sentences from the dataset.
         """
-        with open(self._file_path, newline='',encoding="utf-8") as csv_file:
-            csv_reader = csv.DictReader(csv_file, delimiter=self.delimiter)
+        with open(self._file_path, newline='', encoding="utf-8") as csv_file:
+            csv_reader = csv.reader(csv_file, delimiter=self.delimiter)
+            header = next(csv_reader, None)
+            if header is None:
+                return []
 
-            samples = []
-            for sent_indx, row in enumerate(csv_reader):
-                if not self.column_map:
-                    self.column_map = self._match_column_names(list(row.keys()))
+            self.column_map = self._match_column_names(header)
 
-                if self.task == 'ner':
+            samples = []
+            if self.task == 'ner':
+                indexes = tuple(self.column_map[key] for key in ('text', 'ner', 'pos', 'chunk'))
+                #   blank lines are skipped, as csv.DictReader used to do
+                rows = (row for row in csv_reader if row)
+                for sent_indx, row in enumerate(rows):
                     samples.append(
-                        self._row_to_ner_sample(row, sent_indx)
+                        self._row_to_ner_sample(row, sent_indx, indexes)
                     )
 
-                elif self.task == 'text-classification':
-                    samples.append(
-                        self._row_to_seq_classification_sample(row)
-                    )
+        if self.task == 'text-classification':
+            samples = self._load_seq_classification_samples()
 
         return samples
 
@@ -260,108 +316,170 @@ class CSVDataset(_IDataset):
             output_path (str):
                 path to save the data to
         """
-        temp_id = None
-        otext = ""
-        for i in data:
-            if isinstance(i, NEROutput):
+        otext = []
+        if self.task == 'ner':
+            temp_id = None
+            for i in data:
                 text, temp_id = Formatter.process(i, output_format='csv', temp_id=temp_id)
-            else:
-                text = Formatter.process(i, output_format='csv')
-            otext += text
+                otext.append(text)
+        else:
+            otext.extend(Formatter.process(i, output_format='csv') for i in data)
+
+        with open(output_path, "w", encoding="utf-8", newline="") as fwriter:
+            fwriter.writelines(otext)
 
-        with open(output_path, "wb") as fwriter:
-            fwriter.write(bytes(otext, encoding="utf-8"))
+    def _load_seq_classification_samples(self) -> List[Sample]:
+        """
+        Loads the text-classification samples with the pandas C parser, one chunk of rows at a time.
+        Returns:
+            List[Sample]:
+                samples built from the text and label columns found by `_match_column_names`
+        Raises:
+            ValueError: if a row has an empty or missing text or label field
+        """
+        text_index, label_index = self.column_map['text'], self.column_map['label']
+        #   pandas returns the selected columns in file order
+        text_pos, label_pos = (0, 1) if text_index < label_index else (1, 0)
+
+        samples = []
+        chunks = pd.read_csv(
+            self._file_path,
+            sep=self.delimiter,
+            usecols=[text_index, label_index],
+            dtype=str,
+            #   only empty or missing fields count as NA, so that texts such as "NA" are kept
+            keep_default_na=False,
+            na_values=[''],
+            encoding="utf-8",
+            engine="c",
+            chunksize=self.CHUNK_SIZE
+        )
+        for chunk in chunks:
+            missing = chunk.isna().any(axis=1)
+            if missing.any():
+                raise ValueError(f"Row ({missing.idxmax()}th) of the given CSV file has no text or label value.")
+            texts = chunk.iloc[:, text_pos].tolist()
+            labels = chunk.iloc[:, label_pos].tolist()
+            #   label score should be 1 since it is ground truth, required for __eq__
+            samples.extend(
+                Sample(original=text, expected_results=SequenceClassificationOutput(
+                    predictions=[SequenceLabel(label=label, score=1)]
+                ))
+                for text, label in zip(texts, labels)
+            )
+        return samples
 
     @staticmethod
-    def _find_delimiter(file_path: str) -> property:
+    def _find_delimiter(file_path: str) -> str:
         """
         Helper function in charge of finding the delimiter character in a csv file.
         Args:
             file_path (str):
                 location of the csv file to load
         Returns:
-            property:
+            str:
+                delimiter character of the file
         """
-        sniffer = csv.Sniffer()
-        with open(file_path, encoding="utf-8") as fp:
-            first_line = fp.readline()
-            delimiter = sniffer.sniff(first_line).delimiter
-        return delimiter
+        return _sniff_delimiter(file_path, os.path.getmtime(file_path))
 
-    def _row_to_ner_sample(self, row: Dict[str, List[str]], sent_index: int) -> Sample:
+    def _row_to_ner_sample(self, row: List[str], sent_index: int, indexes: Tuple[int, ...]) -> Sample:
         """
         Convert a row from the dataset into a Sample for the NER task.
         Args:
-            row (Dict[str, List[str]]):
-                single row of the dataset
+            row (List[str]):
+                single row of the dataset, each NER column holds a list literal of tokens or labels,
+                e.g. "['EU', 'rejects', 'German', 'call']"
             sent_index (int):
+            indexes (Tuple[int, ...]):
+                indexes of the text, ner, pos and chunk columns in the row
         Returns:
             Sample:
                 row formatted into a Sample object
         """
-        assert all(isinstance(value, list) for value in row.values()), \
+        columns = [self._parse_list_cell(row[index]) for index in indexes]
+        assert all(isinstance(value, list) for value in columns), \
             ValueError(f"Column ({sent_index}th) values should be list that contains tokens or labels. "
                        "Given CSV file has invalid values")
 
-        token_num = len(row['text'])
-        assert all(len(value) == token_num for value in row.values()), \
+        tokens, ner_col, pos_col, chunk_col = columns
+        token_num = len(tokens)
+        assert all(len(value) == token_num for value in columns), \
             ValueError(f"Column ({sent_index}th) values should have same length with number of token in text, "
                        f"which is {token_num}")
 
-        original = " ".join(self.column_map['text'])
+        original = " ".join(tokens)
         ner_labels = list()
         cursor = 0
-        for token_indx in range(len(self.column_map['text'])):
-            token = row[self.column_map['text']][token_indx]
+        for token_indx, token in enumerate(tokens):
+            token_len = len(token)
             ner_labels.append(
                 NERPrediction.from_span(
-                    entity=row[self.column_map['ner']][token_indx],
+                    entity=ner_col[token_indx],
                     word=token,
                     start=cursor,
-                    end=cursor + len(token),
-                    pos_tag=row[self.column_map['pos']][token_indx]
-                    if row.get(self.column_map['pos'], None) else None,
-                    chunk_tag=row[self.column_map['chunk']][token_indx]
-                    if row.get(self.column_map['chunk'], None) else None,
+                    end=cursor + token_len,
+                    pos_tag=pos_col[token_indx] if pos_col else None,
+                    chunk_tag=chunk_col[token_indx] if chunk_col else None,
                 )
             )
-            cursor += len(token) + 1  # +1 to account for the white space
+            cursor += token_len + 1  # +1 to account for the white space
 
         return Sample(original=original, expected_results=NEROutput(predictions=ner_labels))
 
-    def _row_to_seq_classification_sample(self, row: Dict[str, str]) -> Sample:
+    @staticmethod
+    def _parse_list_cell(value: str):
         """
-        Convert a row from the dataset into a Sample for the text-classification task
+        Parses a cell holding a list literal of tokens or labels.
         Args:
-            row (Dict[str, str]):
-                single row of the dataset
+            value (str):
+                raw value of the cell
         Returns:
-            Sample:
-                row formatted into a Sample object
+            the parsed list with its items as strings, or `value` itself if it is not a valid literal
         """
-        original = row[self.column_map['text']]
-        #   label score should be 1 since it is ground truth, required for __eq__
-        label = SequenceLabel(label=row[self.column_map['label']], score=1)
-
-        return Sample(original=original, expected_results=SequenceClassificationOutput(predictions=[label]))
-
-    def _match_column_names(self, column_names: List[str]) -> Dict[str, str]:
+        try:
+            parsed = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+        if isinstance(parsed, list):
+            return [str(item) for item in parsed]
+        return parsed
+
+    def _match_column_names(self, column_names: List[str]) -> Dict[str, int]:
         """
         Helper function to map original column into standardized ones.
         Args:
             column_names (List[str]):
                 list of column names of the csv file
         Returns:
-            Dict[str, str]:
-                mapping from the original column names into 'standardized' names
+            Dict[str, int]:
+                mapping from the 'standardized' names to the index of the matching column
+        """
+        return dict(self._resolve_column_names(self.task, tuple(column_names)))
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _resolve_column_names(cls, task: str, column_names: Tuple[str, ...]) -> Dict[str, int]:
+        """
+        Memoized implementation of `_match_column_names`, the mapping only depends on the task and the header.
+        Args:
+            task (str):
+                task the csv file is loaded for
+            column_names (Tuple[str, ...]):
+                column names of the csv file
+        Returns:
+            Dict[str, int]:
+                mapping from the 'standardized' names to the index of the matching column
         """
-        column_map = {k: None for k in self.COLUMN_NAMES}
-        for c in column_names:
-            for key, reference_columns in self.COLUMN_NAMES.items():
-                if c.lower() in reference_columns:
-                    column_map[key] = c
+        reference_columns = cls.COLUMN_NAMES[task]
+        alias_to_key = cls.ALIAS_TO_KEY[task]
+
+        column_map = {k: None for k in reference_columns}
+        for index, c in enumerate(column_names):
+            key = alias_to_key.get(c.strip().lower())
+            if key:
+                column_map[key] = index
 
-        not_referenced_columns = {k: self.COLUMN_NAMES[k] for k, v in column_map.items() if v is None}
+        not_referenced_columns = {k: reference_columns[k] for k, v in column_map.items() if v is None}
         if not_referenced_columns:
             raise OSError(
                 f"CSV file is invalid. CSV handler works with template column names!\n"
@@ -1,6 +1,8 @@
 import importlib
+import threading
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from typing import List, Union
+from typing import List, Optional, Union
 
 from ..utils.custom_types import NEROutput, SequenceClassificationOutput
 
@@ -22,6 +24,27 @@ class _ModelHandler(ABC):
         """Perform predictions on input text."""
         return NotImplementedError()
 
+    def predict_batch(
+            self,
+            texts: List[str],
+            batch_size: int = 32,
+            **kwargs
+    ) -> List[Union[NEROutput, SequenceClassificationOutput]]:
+        """Perform predictions on a list of texts.
+
+        Handlers whose backend supports batched inference should override this method, the default
+        implementation runs the texts one by one.
+
+        Args:
+            texts (List[str]): Input texts to perform predictions on.
+            batch_size (int): Number of texts to send to the model at once.
+
+        Returns:
+            List[Union[NEROutput, SequenceClassificationOutput]]:
+                predicted outputs, in the same order as `texts`
+        """
+        return [self(text=text, **kwargs) for text in texts]
+
 
 class ModelFactory:
     """
@@ -32,10 +55,43 @@ class ModelFactory:
     SUPPORTED_MODULES = ['pyspark', 'sparknlp', 'nlu', 'transformers', 'spacy']
     SUPPORTED_HUBS = ['johnsnowlabs', 'spacy', 'huggingface']
 
+    #   module the model object comes from -> model handler module
+    _MODULE_HANDLERS = {
+        'pyspark': 'nlptest.modelhandler.jsl_modelhandler',
+        'sparknlp': 'nlptest.modelhandler.jsl_modelhandler',
+        'nlu': 'nlptest.modelhandler.jsl_modelhandler',
+        'transformers': 'nlptest.modelhandler.transformers_modelhandler',
+        'spacy': 'nlptest.modelhandler.spacy_modelhandler',
+    }
+    #   hub -> (model handler module, required library, installation instructions)
+    _HUB_HANDLERS = {
+        'johnsnowlabs': (
+            'nlptest.modelhandler.jsl_modelhandler',
+            'johnsnowlabs',
+            """Please install the johnsnowlabs library by calling `pip install johnsnowlabs`.
+                For in-depth instructions, head-over to https://nlu.johnsnowlabs.com/docs/en/install"""
+        ),
+        'huggingface': (
+            'nlptest.modelhandler.transformers_modelhandler',
+            'transformers',
+            """Please install the transformers library by calling `pip install transformers`.
+                For in-depth instructions, head-over to https://huggingface.co/docs/transformers/installation"""
+        ),
+        'spacy': (
+            'nlptest.modelhandler.spacy_modelhandler',
+            'spacy',
+            """Please install the spacy library by calling `pip install spacy`.
+                For in-depth instructions, head-over to https://spacy.io/usage"""
+        ),
+    }
+    #   (task, hub, path, keyword arguments) -> loaded model
+    _model_cache = {}
+
     def __init__(
             self,
             model: str,
             task: str,
+            cache_size: int = 10000,
     ):
         """Initializes the ModelFactory object.
         Args:
@@ -43,6 +99,9 @@ class ModelFactory:
                 path to the model to evaluate
             task (str):
                 task to perform
+            cache_size (int):
+                maximum number of predictions to keep in memory, the least recently used ones are
+                dropped first
 
         Raises:
             ValueError: If the task specified is not supported.
@@ -56,18 +115,19 @@ class ModelFactory:
             ValueError(f"Module '{module_name}' is not supported. "
                        f"Please choose one of: {', '.join(self.SUPPORTED_MODULES)}")
 
-        if module_name in ['pyspark', 'sparknlp', 'nlu']:
-            model_handler = importlib.import_module(f'nlptest.modelhandler.jsl_modelhandler')
-        else:
-            model_handler = importlib.import_module(f'nlptest.modelhandler.{module_name}_modelhandler')
+        model_handler = importlib.import_module(self._MODULE_HANDLERS[module_name])
 
         if task == 'ner':
             self.model_class = model_handler.PretrainedModelForNER(model)
         else:
             self.model_class = model_handler.PretrainedModelForTextClassification(model)
 
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
     @classmethod
-    def load_model(cls, task: str, hub: str, path: str) -> 'ModelFactory':
+    def load_model(cls, task: str, hub: str, path: str, **kwargs) -> 'ModelFactory':
         """Loads the model.
 
         Args:
@@ -77,8 +137,13 @@ class ModelFactory:
                 task to perform
             hub (str):
                 model hub to load custom model from the path, either to hub or local disk.
+            kwargs:
+                additional keyword arguments passed to the hub specific `load_model`,
+                e.g. `accelerator="ort"` for huggingface models
 
-        Returns
+        Returns:
+            ModelFactory: factory wrapping the loaded model. Loaded models are kept in memory, so
+                loading the same model again with the same arguments does not reload it.
         """
 
         assert task in cls.SUPPORTED_TASKS, \
@@ -87,48 +152,125 @@ class ModelFactory:
         assert hub in cls.SUPPORTED_HUBS, \
             ValueError(f"Invalid 'hub' parameter. Supported hubs are: {', '.join(cls.SUPPORTED_HUBS)}")
 
-        if hub == 'johnsnowlabs':
-            if importlib.util.find_spec('johnsnowlabs'):
-                modelhandler_module = importlib.import_module('nlptest.modelhandler.jsl_modelhandler')
-            else:
-                raise ModuleNotFoundError("""Please install the johnsnowlabs library by calling `pip install johnsnowlabs`.
-                For in-depth instructions, head-over to https://nlu.johnsnowlabs.com/docs/en/install""")
-            
-        elif hub == 'huggingface':
-            if importlib.util.find_spec('transformers'):
-                modelhandler_module = importlib.import_module('nlptest.modelhandler.transformers_modelhandler')
-            else:
-                raise ModuleNotFoundError("""Please install the transformers library by calling `pip install transformers`.
-                For in-depth instructions, head-over to https://huggingface.co/docs/transformers/installation""")
-            
-        elif hub == "spacy":
-            if importlib.util.find_spec('spacy'):
-                modelhandler_module = importlib.import_module(f'nlptest.modelhandler.{hub}_modelhandler')
-            else:
-                raise ModuleNotFoundError("""Please install the spacy library by calling `pip install spacy`.
-                For in-depth instructions, head-over to https://spacy.io/usage""")
+        module_path, required_lib, install_message = cls._HUB_HANDLERS[hub]
+        if importlib.util.find_spec(required_lib) is None:
+            raise ModuleNotFoundError(install_message)
+        modelhandler_module = importlib.import_module(module_path)
 
-        if task == 'ner':
-            model_class = modelhandler_module.PretrainedModelForNER.load_model(path)
-        else:
-            model_class = modelhandler_module.PretrainedModelForTextClassification.load_model(path)
+        kwargs_key = cls._kwargs_key(kwargs)
+        cache_key = (task, hub, path, kwargs_key) if kwargs_key is not None else None
+        model_class = cls._model_cache.get(cache_key) if cache_key is not None else None
+
+        if model_class is None:
+            if task == 'ner':
+                model_class = modelhandler_module.PretrainedModelForNER.load_model(path, **kwargs)
+            else:
+                model_class = modelhandler_module.PretrainedModelForTextClassification.load_model(path, **kwargs)
+            if cache_key is not None:
+                model_class = cls._model_cache.setdefault(cache_key, model_class)
 
         return cls(
             model_class,
             task
         )
 
-    def predict(self, text: str, **kwargs) -> Union[NEROutput, SequenceClassificationOutput]:
+    @classmethod
+    def clear_model_cache(cls) -> None:
+        """Releases the models kept by `load_model`."""
+        cls._model_cache.clear()
+
+    def predict(self, text: Union[str, List[str]], **kwargs) -> Union[NEROutput, SequenceClassificationOutput, List]:
         """Perform predictions on input text.
 
+        Outputs are cached on the input text and keyword arguments, so that texts which were already
+        seen are not sent to the model again. Cached outputs are handed out as copies since samples
+        realign the spans of their predictions in place.
+
         Args:
-            text (str): Input text to perform predictions on.
+            text (str | List[str]): Input text, or list of texts, to perform predictions on.
+                A list is sent to the model in batches.
 
         Returns:
-            Union[NEROutput, SequenceClassificationOutput]:
-                predicted output
+            Union[NEROutput, SequenceClassificationOutput, List]:
+                predicted output, or list of predicted outputs if a list of texts was given
         """
-        return self.model_class(text=text, **kwargs)
+        kwargs_key = self._kwargs_key(kwargs)
+        if kwargs_key is None:
+            if isinstance(text, list):
+                return self.model_class.predict_batch(text, **kwargs)
+            return self.model_class(text=text, **kwargs)
+
+        texts = text if isinstance(text, list) else [text]
+        results = []
+        with self._cache_lock:
+            for t in texts:
+                output = self._cache.get((t, kwargs_key))
+                if output is not None:
+                    self._cache.move_to_end((t, kwargs_key))
+                    output = self._copy_output(output)
+                results.append(output)
+        missing = list(dict.fromkeys(t for t, output in zip(texts, results) if output is None))
+
+        if missing:
+            if isinstance(text, list):
+                outputs = dict(zip(missing, self.model_class.predict_batch(missing, **kwargs)))
+            else:
+                outputs = {text: self.model_class(text=text, **kwargs)}
+            with self._cache_lock:
+                for t, output in outputs.items():
+                    # callers get the fresh output while the cache keeps an untouched copy of it
+                    self._cache[(t, kwargs_key)] = self._copy_output(output)
+                    self._cache.move_to_end((t, kwargs_key))
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+            handed_out = set()
+            for i, t in enumerate(texts):
+                if results[i] is None:
+                    results[i] = self._copy_output(outputs[t]) if t in handed_out else outputs[t]
+                    handed_out.add(t)
+
+        return results if isinstance(text, list) else results[0]
+
+    def cache_clear(self) -> None:
+        """Empties the cache of predictions."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _copy_output(output: Union[NEROutput, SequenceClassificationOutput]) -> Union[NEROutput, SequenceClassificationOutput]:
+        """Copies a prediction output so that its spans can be changed without affecting the original.
+
+        Args:
+            output (Union[NEROutput, SequenceClassificationOutput]): output to copy
+
+        Returns:
+            Union[NEROutput, SequenceClassificationOutput]: copied output
+        """
+        if isinstance(output, NEROutput):
+            return NEROutput.construct(
+                predictions=[p.copy(update={"span": p.span.copy()}) for p in output.predictions]
+            )
+        if isinstance(output, SequenceClassificationOutput):
+            return SequenceClassificationOutput.construct(predictions=list(output.predictions))
+        return output.copy(deep=True)
+
+    @staticmethod
+    def _kwargs_key(kwargs: dict) -> Optional[frozenset]:
+        """Builds the part of a cache key coming from keyword arguments.
+
+        Args:
+            kwargs (dict): keyword arguments given to `predict` or `load_model`
+
+        Returns:
+            Optional[frozenset]: hashable key, or None if some arguments are not hashable
+        """
+        try:
+            key = frozenset((k, v) for k, v in kwargs.items() if k != "batch_size")
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
     def predict_raw(self, text: str) -> List[str]:
         """Perform predictions on input text.
@@ -141,14 +283,14 @@ class ModelFactory:
         """
         return self.model_class.predict_raw(text)
 
-    def __call__(self, text: str, *args, **kwargs) -> Union[NEROutput, SequenceClassificationOutput]:
+    def __call__(self, text: Union[str, List[str]], *args, **kwargs) -> Union[NEROutput, SequenceClassificationOutput, List]:
         """Alias of the 'predict' method
 
         Args:
-            text (str): Input text to perform predictions on.
+            text (str | List[str]): Input text, or list of texts, to perform predictions on.
 
         Returns:
-            Union[NEROutput, SequenceClassificationOutput]:
-                predicted output
+            Union[NEROutput, SequenceClassificationOutput, List]:
+                predicted output, or list of predicted outputs if a list of texts was given
         """
-        return self.model_class(text=text, **kwargs)
+        return self.predict(text, **kwargs)
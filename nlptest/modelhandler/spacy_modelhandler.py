@@ -1,12 +1,35 @@
+import logging
 from typing import List
 
 import spacy
-from spacy.tokens import Doc
+from spacy.attrs import ENT_IOB, ENT_TYPE
+from spacy.language import Language
+from spacy.tokens import Doc, Token
 
 from .modelhandler import _ModelHandler
 from ..utils.custom_types import NEROutput, NERPrediction, SequenceClassificationOutput
 
 
+def _load_pipeline(path: str, gpu: bool = False) -> Language:
+    """Load a SpaCy pipeline, on GPU if requested and available.
+
+    Args:
+        path (str): name of, or path to, the SpaCy pipeline
+        gpu (bool): whether to run the pipeline on GPU
+
+    Returns:
+        Language: loaded SpaCy pipeline
+    """
+    # the GPU has to be activated before loading the pipeline for its weights to be allocated on it
+    if gpu and not spacy.prefer_gpu():
+        logging.warning("No GPU available, loading SpaCy pipeline '%s' on CPU instead.", path)
+    try:
+        return spacy.load(path)
+    except:
+        raise ValueError(
+            f'''Model "{path}" is not found online or local. Please install it by python -m spacy download {path} or check the path.''')
+
+
 class PretrainedModelForNER(_ModelHandler):
     """
     Args:
@@ -25,14 +48,14 @@ class PretrainedModelForNER(_ModelHandler):
         self.model = model
 
     @classmethod
-    def load_model(cls, path):
-        """Load and return SpaCy pipeline"""
+    def load_model(cls, path: str, gpu: bool = False):
+        """Load and return SpaCy pipeline
 
-        try:
-            return spacy.load(path)
-        except:
-            raise ValueError(
-                f'''Model "{path}" is not found online or local. Please install it by python -m spacy download {path} or check the path.''')
+        Args:
+            path (str): name of, or path to, the SpaCy pipeline
+            gpu (bool): whether to run the pipeline on GPU
+        """
+        return _load_pipeline(path, gpu=gpu)
 
     def predict(self, text: str, *args, **kwargs) -> NEROutput:
         """Perform predictions on the input text.
@@ -50,6 +73,23 @@ class PretrainedModelForNER(_ModelHandler):
         doc = self.model(text)
 
         # if kwargs.get("group_entities"):
+        return self._to_ner_output(doc)
+
+    def predict_batch(self, texts: List[str], batch_size: int = 32, **kwargs) -> List[NEROutput]:
+        """Perform predictions on a list of texts, streaming them through `nlp.pipe`.
+
+        Args:
+            texts (List[str]): Input texts to perform NER on.
+            batch_size (int): Number of texts processed by the pipeline at once.
+
+        Returns:
+            List[NEROutput]: Named entities recognized in each text, in the same order as `texts`.
+        """
+        return [self._to_ner_output(doc) for doc in self.model.pipe(texts, batch_size=batch_size)]
+
+    @staticmethod
+    def _to_ner_output(doc: Doc) -> NEROutput:
+        """Convert the entities of a processed Doc into a NEROutput."""
         return NEROutput(
             predictions=[
                 NERPrediction.from_span(
@@ -77,7 +117,18 @@ class PretrainedModelForNER(_ModelHandler):
         """
 
         doc = self.model(text)
-        return [f"{token.ent_iob_}-{token.ent_type_}" if token.ent_type_ else token.ent_iob_ for token in doc]
+        iob_strings = Token.iob_strings()
+        strings = doc.vocab.strings
+
+        #   reading the entity attributes of all tokens at once avoids building a Token object per token
+        labels, label_cache = [], {}
+        for iob, ent_type in doc.to_array([ENT_IOB, ENT_TYPE]).tolist():
+            label = label_cache.get((iob, ent_type))
+            if label is None:
+                label = f"{iob_strings[iob]}-{strings[ent_type]}" if ent_type else iob_strings[iob]
+                label_cache[(iob, ent_type)] = label
+            labels.append(label)
+        return labels
 
 
 class PretrainedModelForTextClassification(_ModelHandler):
@@ -103,13 +154,14 @@ class PretrainedModelForTextClassification(_ModelHandler):
         return self.model.get_pipe("textcat").labels
 
     @classmethod
-    def load_model(cls, path: str):
-        """Load and return SpaCy pipeline"""
-        try:
-            return spacy.load(path)
-        except:
-            raise ValueError(
-                f'''Model "{path}" is not found online or local. Please install it by python -m spacy download {path} or check the path.''')
+    def load_model(cls, path: str, gpu: bool = False):
+        """Load and return SpaCy pipeline
+
+        Args:
+            path (str): name of, or path to, the SpaCy pipeline
+            gpu (bool): whether to run the pipeline on GPU
+        """
+        return _load_pipeline(path, gpu=gpu)
 
     def predict(self, text: str, return_all_scores: bool = False, *args, **kwargs) -> SequenceClassificationOutput:
         """Perform text classification predictions on the input text.
@@ -121,7 +173,34 @@ class PretrainedModelForTextClassification(_ModelHandler):
         Returns:
             SequenceClassificationOutput: Text classification predictions from the input text.
         """
-        output = self.model(text).cats
+        return self._to_classification_output(self.model(text), return_all_scores)
+
+    def predict_batch(
+            self,
+            texts: List[str],
+            batch_size: int = 32,
+            return_all_scores: bool = False,
+            **kwargs
+    ) -> List[SequenceClassificationOutput]:
+        """Perform text classification predictions on a list of texts, streaming them through `nlp.pipe`.
+
+        Args:
+            texts (List[str]): Input texts to classify.
+            batch_size (int): Number of texts processed by the pipeline at once.
+            return_all_scores (bool): Option to return score for all labels.
+
+        Returns:
+            List[SequenceClassificationOutput]: Text classification predictions, in the same order as `texts`.
+        """
+        return [
+            self._to_classification_output(doc, return_all_scores)
+            for doc in self.model.pipe(texts, batch_size=batch_size)
+        ]
+
+    @staticmethod
+    def _to_classification_output(doc: Doc, return_all_scores: bool = False) -> SequenceClassificationOutput:
+        """Convert the categories of a processed Doc into a SequenceClassificationOutput."""
+        output = doc.cats
         if not return_all_scores:
             label = max(output, key=output.get)
             output = [{"label": label, "score": output[label]}]
@@ -130,7 +209,7 @@ class PretrainedModelForTextClassification(_ModelHandler):
                       for key, value in output.items()]
 
         return SequenceClassificationOutput(
-            text=text,
+            text=doc.text,
             predictions=output
         )
 
@@ -1,4 +1,7 @@
-from typing import Dict, List, Tuple
+import importlib
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from transformers import Pipeline, pipeline
@@ -6,6 +9,106 @@ from transformers import Pipeline, pipeline
 from .modelhandler import _ModelHandler
 from ..utils.custom_types import NEROutput, NERPrediction, SequenceClassificationOutput
 
+ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nlptest", "onnx")
+#   transformers task name -> name of the same task in optimum
+ORT_TASKS = {"ner": "token-classification", "text-classification": "text-classification"}
+
+
+def _load_ort_pipeline(path: str, task: str, quantize: bool = False, **kwargs) -> Pipeline:
+    """Exports a model to ONNX and wraps it into an ONNX Runtime backed pipeline.
+
+    The exported (and quantized) models are stored under `ONNX_CACHE_DIR` and reused by later loads
+    of the same model.
+
+    Args:
+        path (str):
+            path to model or model name
+        task (str):
+            pipeline task, either 'ner' or 'text-classification'
+        quantize (bool):
+            whether to apply dynamic int8 quantization to the exported model
+        kwargs:
+            additional keyword arguments passed to the pipeline
+
+    Returns:
+        Pipeline:
+            pipeline running the model with ONNX Runtime
+    """
+    if importlib.util.find_spec('optimum') is None:
+        raise ModuleNotFoundError("""Please install the optimum library by calling `pip install optimum[onnxruntime]`.
+                For in-depth instructions, head-over to https://huggingface.co/docs/optimum/installation""")
+
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTModelForTokenClassification
+    from optimum.pipelines import pipeline as ort_pipeline
+    from transformers import AutoTokenizer
+
+    ort_model_class = ORTModelForTokenClassification if task == "ner" else ORTModelForSequenceClassification
+    save_dir = os.path.join(ONNX_CACHE_DIR, path.strip("/").replace("/", "--"))
+
+    if os.path.isfile(os.path.join(save_dir, "model.onnx")):
+        ort_model = ort_model_class.from_pretrained(save_dir, file_name="model.onnx")
+    else:
+        ort_model = ort_model_class.from_pretrained(path, export=True)
+        ort_model.save_pretrained(save_dir)
+
+    if quantize:
+        if not os.path.isfile(os.path.join(save_dir, "model_quantized.onnx")):
+            from optimum.onnxruntime import ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+            quantizer = ORTQuantizer.from_pretrained(ort_model)
+            quantizer.quantize(
+                save_dir=save_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            )
+        ort_model = ort_model_class.from_pretrained(save_dir, file_name="model_quantized.onnx")
+
+    return ort_pipeline(
+        task=ORT_TASKS[task],
+        model=ort_model,
+        tokenizer=AutoTokenizer.from_pretrained(path),
+        accelerator="ort",
+        **kwargs
+    )
+
+
+def _load_torch_pipeline(path: str, task: str, fp16: bool = False, torch_compile: bool = False, **kwargs) -> Pipeline:
+    """Loads a PyTorch pipeline, optionally in half precision and compiled with `torch.compile`.
+
+    Args:
+        path (str):
+            path to model or model name
+        task (str):
+            pipeline task, either 'ner' or 'text-classification'
+        fp16 (bool):
+            whether to load the weights in float16, only applied when a CUDA device is available
+        torch_compile (bool):
+            whether to compile the model with `torch.compile`
+        kwargs:
+            additional keyword arguments passed to the pipeline
+
+    Returns:
+        Pipeline:
+            loaded pipeline
+    """
+    if fp16 or torch_compile:
+        import torch
+
+    if fp16:
+        if torch.cuda.is_available():
+            kwargs.update(torch_dtype=torch.float16, device=0)
+        else:
+            logging.warning("fp16 requires a CUDA device, loading '%s' in fp32 instead.", path)
+
+    model = pipeline(model=path, task=task, **kwargs)
+
+    if torch_compile:
+        # sequence lengths vary from one text to another, hence the dynamic shapes
+        model.model = torch.compile(model.model, dynamic=True)
+        # warmup so that the compilation does not happen during the first prediction
+        model("hello world")
+    return model
+
 
 class PretrainedModelForNER(_ModelHandler):
     """
@@ -122,17 +225,36 @@ class PretrainedModelForNER(_ModelHandler):
         return entity_groups
 
     @classmethod
-    def load_model(cls, path: str) -> 'Pipeline':
+    def load_model(
+            cls,
+            path: str,
+            accelerator: Optional[str] = None,
+            quantize: bool = False,
+            fp16: bool = False,
+            torch_compile: bool = False
+    ) -> 'Pipeline':
         """Load the NER model into the `model` attribute.
 
         Args:
             path (str):
                 path to model or model name
+            accelerator (Optional[str]):
+                set to 'ort' to run the model with ONNX Runtime through optimum
+            quantize (bool):
+                whether to apply dynamic int8 quantization, only used with `accelerator='ort'`
+            fp16 (bool):
+                whether to load the weights in float16 on GPU, ignored on CPU
+            torch_compile (bool):
+                whether to compile the model with `torch.compile`
 
         Returns:
             'Pipeline':
         """
-        return pipeline(model=path, task="ner", ignore_labels=[])
+        if accelerator == "ort":
+            return _load_ort_pipeline(path, task="ner", quantize=quantize, ignore_labels=[])
+        if accelerator is not None:
+            raise ValueError(f"Accelerator '{accelerator}' not supported. Please choose one of: ort")
+        return _load_torch_pipeline(path, task="ner", fp16=fp16, torch_compile=torch_compile, ignore_labels=[])
 
     def predict(self, text: str, **kwargs) -> NEROutput:
         """Perform predictions on the input text.
@@ -148,6 +270,35 @@ class PretrainedModelForNER(_ModelHandler):
             NEROutput: A list of named entities recognized in the input text.
         """
         predictions = self.model(text, **kwargs)
+        return self._to_ner_output(predictions)
+
+    def predict_batch(self, texts: List[str], batch_size: int = 32, **kwargs) -> List[NEROutput]:
+        """Perform predictions on a list of texts, sending them through the pipeline in batches.
+
+        Args:
+            texts (List[str]): Input texts to perform NER on.
+            batch_size (int): Number of texts per forward pass.
+            kwargs: Additional keyword arguments.
+
+        Returns:
+            List[NEROutput]: Named entities recognized in each text, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        predictions = self.model(texts, batch_size=batch_size, **kwargs)
+        return [self._to_ner_output(prediction) for prediction in predictions]
+
+    def _to_ner_output(self, predictions: List[Dict]) -> NEROutput:
+        """
+        Aggregates and groups the raw pipeline predictions of a single text.
+
+        Args:
+            predictions (List[Dict]):
+                predictions obtained with the pipeline object
+        Returns:
+            NEROutput:
+                named entities recognized in the text
+        """
         aggregated_words = self._aggregate_words(predictions)
         aggregated_predictions = self.group_entities(aggregated_words)
 
@@ -205,9 +356,33 @@ class PretrainedModelForTextClassification(_ModelHandler):
         return list(self.model.model.config.id2label.values())
 
     @classmethod
-    def load_model(cls, path: str) -> "Pipeline":
-        """Load and return text classification transformers pipeline"""
-        return pipeline(model=path, task="text-classification")
+    def load_model(
+            cls,
+            path: str,
+            accelerator: Optional[str] = None,
+            quantize: bool = False,
+            fp16: bool = False,
+            torch_compile: bool = False
+    ) -> "Pipeline":
+        """Load and return text classification transformers pipeline
+
+        Args:
+            path (str):
+                path to model or model name
+            accelerator (Optional[str]):
+                set to 'ort' to run the model with ONNX Runtime through optimum
+            quantize (bool):
+                whether to apply dynamic int8 quantization, only used with `accelerator='ort'`
+            fp16 (bool):
+                whether to load the weights in float16 on GPU, ignored on CPU
+            torch_compile (bool):
+                whether to compile the model with `torch.compile`
+        """
+        if accelerator == "ort":
+            return _load_ort_pipeline(path, task="text-classification", quantize=quantize)
+        if accelerator is not None:
+            raise ValueError(f"Accelerator '{accelerator}' not supported. Please choose one of: ort")
+        return _load_torch_pipeline(path, task="text-classification", fp16=fp16, torch_compile=torch_compile)
 
     def predict(self, text: str, return_all_scores: bool = False, truncation_strategy: str = "longest_first", *args,
                 **kwargs) -> SequenceClassificationOutput:
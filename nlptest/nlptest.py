@@ -1,8 +1,9 @@
+import copy
 import logging
 import os
 import pickle
-from collections import defaultdict
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
 
 import pandas as pd
 import yaml
@@ -13,6 +14,12 @@ from .datahandler.datasource import DataFactory
 from .modelhandler import ModelFactory
 from .testrunner import BaseRunner
 from .transform import TestFactory
+from .utils.custom_types import Sample
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
 
 
 class Harness:
@@ -32,6 +39,8 @@ class Harness:
         ("text-classification", "textcat_imdb", "spacy"): "imdb/sample.csv",
         ("text-classification", "en.sentiment.imdb.glove", "johnsnowlabs"): "imdb/sample.csv"
     }
+    #   (config path, modification time) -> parsed configuration
+    _cfg_cache = {}
 
     def __init__(
             self,
@@ -58,32 +67,51 @@ class Harness:
         super().__init__()
         self.task = task
 
+        default_dataset = None
         if data is None and (task, model, hub) in self.DEFAULTS_DATASET.keys():
             data_path = os.path.join("data", self.DEFAULTS_DATASET[(task, model, hub)])
             data = resource_filename("nlptest", data_path)
-            self.data = DataFactory(data, task=self.task).load()
             if model == "textcat_imdb":
                 model = resource_filename("nlptest", "data/textcat_imdb")
-
-            logging.info(f"Default dataset '{(task, model, hub)}' successfully loaded.")
+            default_dataset = (task, model, hub)
 
         elif data is None and (task, model, hub) not in self.DEFAULTS_DATASET.keys():
             raise ValueError(f"You haven't specified any value for the parameter 'data' and the configuration you "
                              f"passed is not among the default ones. You need to either specify the parameter 'data' "
                              f"or use a default configuration.")
-        elif isinstance(data, list):
-            self.data = data
-        else:
-            self.data = DataFactory(data, task=self.task).load() if data is not None else None
 
-        if isinstance(model, str):
-            if hub is None:
-                raise OSError(f"You need to pass the 'hub' parameter when passing a string as 'model'.")
+        if isinstance(model, str) and hub is None:
+            raise OSError(f"You need to pass the 'hub' parameter when passing a string as 'model'.")
 
-            self.model = ModelFactory.load_model(path=model, task=task, hub=hub)
+        # data parsing and model loading are independent, so the model is loaded in the background
+        # while the data is parsed in the calling thread
+        executor = model_future = None
+        if isinstance(model, str):
+            executor = ThreadPoolExecutor(max_workers=1)
+            model_future = executor.submit(ModelFactory.load_model, path=model, task=task, hub=hub)
         else:
             self.model = ModelFactory(task=task, model=model)
 
+        try:
+            if isinstance(data, list):
+                self.data = data
+            else:
+                self.data = DataFactory(data, task=self.task).load()
+        except Exception:
+            # do not wait for a model, possibly being downloaded, before reporting invalid data
+            if executor is not None:
+                executor.shutdown(wait=False)
+            raise
+
+        if executor is not None:
+            try:
+                self.model = model_future.result()
+            finally:
+                executor.shutdown(wait=False)
+
+        if default_dataset is not None:
+            logging.info(f"Default dataset '{default_dataset}' successfully loaded.")
+
         if config is not None:
             self._config = self.configure(config)
         else:
@@ -93,8 +121,6 @@ class Harness:
         self._testcases = None
         self._generated_results = None
         self.accuracy_results = None
-        self.min_pass_dict = None
-        self.default_min_pass_dict = None
         self.df_report = None
 
     def __repr__(self) -> str:
@@ -116,9 +142,18 @@ class Harness:
         if type(config) == dict:
             self._config = config
         else:
-            with open(config, 'r') as yml:
-                self._config = yaml.safe_load(yml)
-        self._config_copy = self._config
+            key = (os.path.abspath(config), os.path.getmtime(config))
+            if key not in self._cfg_cache:
+                with open(config, 'r') as yml:
+                    self._cfg_cache[key] = yaml.load(yml, Loader=SafeLoader)
+            self._config = copy.deepcopy(self._cfg_cache[key])
+        self._config_copy = copy.deepcopy(self._config)
+
+        self.default_min_pass_dict = self._config['defaults'].get('min_pass_rate', 0.65)
+        self.min_pass_dict = {
+            j: k.get('min_pass_rate', self.default_min_pass_dict) for i, v in
+            self._config['tests'].items() for j, k in v.items()
+        }
         return self._config
 
     def generate(self) -> "Harness":
@@ -146,7 +181,8 @@ class Harness:
         self._generated_results = BaseRunner(
             self._testcases,
             self.model,
-            self.data
+            self.data,
+            max_tokens_per_batch=self._config['defaults'].get('max_tokens_per_batch')
         ).evaluate()
         return self
 
@@ -162,30 +198,26 @@ class Harness:
             raise RuntimeError("The tests have not been run yet. Please use the `.run()` method before"
                                "calling the `.report()` method.")
 
-        if isinstance(self._config, dict):
-            self.default_min_pass_dict = self._config['defaults'].get('min_pass_rate', 0.65)
-            self.min_pass_dict = {
-                j: k.get('min_pass_rate', self.default_min_pass_dict) for i, v in \
-                self._config['tests'].items() for j, k in v.items()
-            }
-
-        summary = defaultdict(lambda: defaultdict(int))
+        #   test_type -> [category, pass_count, fail_count]
+        summary = {}
         for sample in self._generated_results:
-            summary[sample.test_type]['category'] = sample.category
-            summary[sample.test_type][str(sample.is_pass()).lower()] += 1
+            counts = summary.get(sample.test_type)
+            if counts is None:
+                counts = summary[sample.test_type] = [sample.category, 0, 0]
+            counts[1 + (not sample.is_pass())] += 1
 
         report = {}
-        for test_type, value in summary.items():
-            pass_rate = summary[test_type]["true"] / (summary[test_type]["true"] + summary[test_type]["false"])
+        for test_type, (category, pass_count, fail_count) in summary.items():
+            pass_rate = pass_count / (pass_count + fail_count)
             min_pass_rate = self.min_pass_dict.get(test_type, self.default_min_pass_dict)
 
-            if summary[test_type]['category'] == "Accuracy":
+            if category == "Accuracy":
                 min_pass_rate = 1
 
             report[test_type] = {
-                "category": summary[test_type]['category'],
-                "fail_count": summary[test_type]["false"],
-                "pass_count": summary[test_type]["true"],
+                "category": category,
+                "fail_count": fail_count,
+                "pass_count": pass_count,
                 "pass_rate": pass_rate,
                 "minimum_pass_rate": min_pass_rate,
                 "pass": pass_rate >= min_pass_rate
@@ -194,8 +226,8 @@ class Harness:
         df_report = pd.DataFrame.from_dict(report, orient="index")
         df_report = df_report.reset_index().rename(columns={'index': 'test_type'})
 
-        df_report['pass_rate'] = df_report['pass_rate'].apply(lambda x: "{:.0f}%".format(x * 100))
-        df_report['minimum_pass_rate'] = df_report['minimum_pass_rate'].apply(lambda x: "{:.0f}%".format(x * 100))
+        df_report['pass_rate'] = df_report['pass_rate'].mul(100).round().astype(int).astype(str) + '%'
+        df_report['minimum_pass_rate'] = df_report['minimum_pass_rate'].mul(100).round().astype(int).astype(str) + '%'
 
         col_to_move = 'category'
         first_column = df_report.pop('category')
@@ -216,7 +248,7 @@ class Harness:
         if self._generated_results is None:
             logging.warning("Please run `Harness.run()` before calling `.generated_results()`.")
             return
-        generated_results_df = pd.DataFrame.from_dict([x.to_dict() for x in self._generated_results])
+        generated_results_df = self._samples_to_frame(self._generated_results)
 
         return generated_results_df
 
@@ -271,11 +303,47 @@ class Harness:
             pd.DataFrame:
                 testcases formatted into a pd.DataFrame
         """
-        final_df = pd.DataFrame([x.to_dict() for x in self._testcases]).drop(["pass", "actual_result"], errors="ignore",
-                                                                             axis=1)
-        final_df = final_df.reset_index(drop=True)
+        final_df = self._samples_to_frame(self._testcases, exclude=("pass", "actual_result"))
         return final_df
 
+    @staticmethod
+    def _samples_to_frame(samples: List[Sample], exclude: Tuple[str, ...] = ()) -> pd.DataFrame:
+        """
+        Builds a DataFrame out of the `to_dict` representation of the samples, filling one list
+        per column in a single pass instead of letting pandas infer the schema row by row. The
+        `category` and `test_type` columns are stored as categoricals.
+
+        Args:
+            samples (List[Sample]): samples to convert
+            exclude (Tuple[str, ...]): keys of the sample dicts that should not become columns
+
+        Returns:
+            pd.DataFrame: one row per sample
+        """
+        columns = {}
+        for index, sample in enumerate(samples):
+            for key, value in sample.to_dict().items():
+                if key in exclude:
+                    continue
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * index
+                column.append(value)
+
+            #   samples that have not been run yet lack some of the keys
+            for column in columns.values():
+                if len(column) <= index:
+                    column.append(None)
+
+        df = pd.DataFrame(columns)
+        #   only a handful of distinct values repeated over every sample
+        for column in ("category", "test_type"):
+            if column in df:
+                df[column] = df[column].astype("category")
+        if "pass" in df and df["pass"].notna().all():
+            df["pass"] = df["pass"].astype(bool)
+        return df
+
     def save(self, save_dir: str) -> None:
         """
         Save the configuration, generated testcases and the `DataFactory` to be reused later.
@@ -297,13 +365,13 @@ class Harness:
             os.mkdir(save_dir)
 
         with open(os.path.join(save_dir, "config.yaml"), 'w') as yml:
-            yml.write(yaml.safe_dump(self._config_copy))
+            yml.write(yaml.dump(self._config_copy, Dumper=SafeDumper))
 
         with open(os.path.join(save_dir, "test_cases.pkl"), "wb") as writer:
-            pickle.dump(self._testcases, writer)
+            pickle.dump(self._testcases, writer, protocol=pickle.HIGHEST_PROTOCOL)
 
         with open(os.path.join(save_dir, "data.pkl"), "wb") as writer:
-            pickle.dump(self.data, writer)
+            pickle.dump(self.data, writer, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def load(cls, save_dir: str, model: Union[str, 'ModelFactory'], task: Optional[str] = "ner",
@@ -1,7 +1,7 @@
 import pandas as pd
 from tqdm import tqdm
 from nlptest.modelhandler import ModelFactory
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from nlptest.utils.custom_types import Sample
 
 
@@ -14,7 +14,9 @@ class BaseRunner:
             self,
             load_testcases: List[Sample],
             model_handler: ModelFactory,
-            data: List[Sample]
+            data: List[Sample],
+            batch_size: int = 32,
+            max_tokens_per_batch: Optional[int] = None
     ) -> None:
         """
         Initialize the BaseRunner class.
@@ -22,10 +24,15 @@ class BaseRunner:
         Args:
             load_testcases (List): List containing the testcases to be evaluated.
             model_handler (spark, spacy, transformer): Object representing the model handler, either spaCy, SparkNLP or transformer.
+            batch_size (int): Number of texts sent to the model at once.
+            max_tokens_per_batch (Optional[int]): If set, batches are filled up to this estimated number of
+                padded tokens instead of `batch_size` texts.
         """
         self.load_testcases = load_testcases.copy()
         self._model_handler = model_handler
         self._data = data
+        self.batch_size = batch_size
+        self.max_tokens_per_batch = max_tokens_per_batch
 
     # @abc.abstractmethod
     def evaluate(self) -> Tuple[List[Sample], pd.DataFrame]:
@@ -35,7 +42,13 @@ class BaseRunner:
             Tuple[List[Sample], pd.DataFrame]
         """
      
-        test_result = TestRunner(self.load_testcases, self._model_handler, self._data).evaluate()
+        test_result = TestRunner(
+            self.load_testcases,
+            self._model_handler,
+            self._data,
+            self.batch_size,
+            self.max_tokens_per_batch
+        ).evaluate()
         
         return test_result
 
@@ -52,12 +65,77 @@ class TestRunner(BaseRunner):
             List[Sample]:
                 all containing the predictions for both the original text and the perturbed one
         """
-        for sample in tqdm(self.load_testcases, desc="Running test cases..."):
-            if sample.state != "done":
-                if sample.category not in ["Robustness","Bias"]:
-                    sample.expected_results = self._model_handler(sample.original)
-                sample.actual_results = self._model_handler(sample.test_case)
-                sample.state = "done"
+        pending = [sample for sample in self.load_testcases if sample.state != "done"]
+
+        texts = []
+        for sample in pending:
+            if sample.category not in ["Robustness", "Bias"]:
+                texts.append(sample.original)
+            texts.append(sample.test_case)
+
+        predictions = iter(self._predict(texts))
+        for sample in pending:
+            if sample.category not in ["Robustness", "Bias"]:
+                sample.expected_results = next(predictions)
+            sample.actual_results = next(predictions)
+            sample.state = "done"
 
         return self.load_testcases
 
+    def _predict(self, texts: List[str]) -> List:
+        """Run the model over all the texts, batching texts of similar length together.
+
+        Args:
+            texts (List[str]): texts to run the model on
+
+        Returns:
+            List: predictions, in the same order as `texts`
+        """
+        #   perturbations often leave texts unchanged, each distinct text only goes through the model once
+        unique_texts = list(dict.fromkeys(texts))
+        unique_predictions = [None] * len(unique_texts)
+        for batch in tqdm(self._make_batches(unique_texts), desc="Running test cases..."):
+            outputs = self._model_handler([unique_texts[index] for index in batch], batch_size=len(batch))
+            for index, output in zip(batch, outputs):
+                unique_predictions[index] = output
+
+        #   samples realign the spans of their predictions in place, hence duplicates get their own copy
+        text_index = {text: index for index, text in enumerate(unique_texts)}
+        predictions, seen = [], set()
+        for text in texts:
+            prediction = unique_predictions[text_index[text]]
+            predictions.append(prediction.copy(deep=True) if text in seen else prediction)
+            seen.add(text)
+        return predictions
+
+    def _make_batches(self, texts: List[str]) -> List[List[int]]:
+        """Groups the texts, sorted by length, into batches so that little padding is needed.
+
+        Batches hold `batch_size` texts, or as many texts as fit in `max_tokens_per_batch`
+        padded tokens when it is set.
+
+        Args:
+            texts (List[str]): texts to run the model on
+
+        Returns:
+            List[List[int]]: indexes in `texts` of the texts making up each batch
+        """
+        batches, batch = [], []
+        for index in sorted(range(len(texts)), key=lambda i: len(texts[i])):
+            if self.max_tokens_per_batch is None:
+                is_full = len(batch) >= self.batch_size
+            else:
+                #   texts are sorted, hence the current one is the longest of the batch
+                is_full = (len(batch) + 1) * self._estimate_tokens(texts[index]) > self.max_tokens_per_batch
+            if batch and is_full:
+                batches.append(batch)
+                batch = []
+            batch.append(index)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough number of tokens of an english text, about four characters per token."""
+        return len(text) // 4 + 1
@@ -2,7 +2,6 @@ from abc import ABC, abstractmethod
 from typing import Dict, List
 from tqdm import tqdm
 
-import nltk
 import pandas as pd
 
 from nlptest.modelhandler import ModelFactory
@@ -145,11 +144,13 @@ class RobustnessTestFactory(ITests):
             raise ValueError(
                 f'Invalid test specification: {not_supported_tests}. Available tests are: {list(self.supported_tests.keys())}')
 
-        if 'swap_entities' in self.tests:
+        if 'swap_entities' in self.tests or 'swap_cohyponyms' in self.tests:
             # TODO: check if we can get rid of pandas here
             df = pd.DataFrame({'text': [sample.original for sample in data_handler],
                                'label': [[i.entity for i in sample.expected_results.predictions]
                                          for sample in data_handler]})
+
+        if 'swap_entities' in self.tests:
             params = self.tests['swap_entities']
             if len(params.get('parameters', {}).get('terminology', {})) == 0:
                 params['parameters'] = {}
@@ -165,11 +166,9 @@ class RobustnessTestFactory(ITests):
             self.tests['british_to_american']['parameters']['accent_map'] = {v: k for k, v in A2B_DICT.items()}
 
         if 'swap_cohyponyms' in self.tests:
+            import nltk
             nltk.download('omw-1.4', quiet=True)
             nltk.download('wordnet', quiet=True)
-            df = pd.DataFrame({'text': [sample.original for sample in data_handler],
-                               'label': [[i.entity for i in sample.expected_results.predictions]
-                                         for sample in data_handler]})
             self.tests['swap_cohyponyms']['parameters'] = {}
             self.tests['swap_cohyponyms']['parameters']['labels'] = df.label.tolist()
 
@@ -188,10 +187,13 @@ class RobustnessTestFactory(ITests):
             data_handler_copy = [x.copy() for x in self._data_handler]
             transformed_samples = self.supported_tests[test_name].transform(data_handler_copy,
                                                                             **params.get('parameters', {}))
+            if not TestFactory.is_augment:
+                #   one batched call, the model handler only runs the originals it has not seen yet
+                expected_results = self._model_handler([sample.original for sample in transformed_samples])
+                for sample, expected_result in zip(transformed_samples, expected_results):
+                    sample.expected_results = expected_result
             for sample in transformed_samples:
                 sample.test_type = test_name
-                if not TestFactory.is_augment:
-                    sample.expected_results = self._model_handler(sample.original)
             all_samples.extend(transformed_samples)
         return all_samples
 
@@ -319,10 +321,13 @@ class BiasTestFactory(ITests):
             data_handler_copy = [x.copy() for x in self._data_handler]
             transformed_samples = self.supported_tests[test_name].transform(data_handler_copy,
                                                                             **params.get('parameters', {}))
+            if not TestFactory.is_augment:
+                #   one batched call, the model handler only runs the originals it has not seen yet
+                expected_results = self._model_handler([sample.original for sample in transformed_samples])
+                for sample, expected_result in zip(transformed_samples, expected_results):
+                    sample.expected_results = expected_result
             for sample in transformed_samples:
                 sample.test_type = test_name
-                if not TestFactory.is_augment:
-                    sample.expected_results = self._model_handler(sample.original)
             all_samples.extend(transformed_samples)
         return all_samples
 
@@ -8,7 +8,6 @@ from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
-import nltk
 
 from .utils import (A2B_DICT, CONTRACTION_MAP, DEFAULT_PERTURBATIONS, PERTURB_CLASS_MAP, TYPO_FREQUENCY,
                     create_terminology, male_pronouns, female_pronouns, neutral_pronouns)
@@ -73,6 +72,7 @@ class PerturbationFactory:
                 v: k for k, v in A2B_DICT.items()}
 
         if 'swap_cohyponyms' in self._tests:
+            import nltk
             nltk.download('omw-1.4', quiet=True)
             nltk.download('wordnet', quiet=True)
             df = pd.DataFrame({'text': [sample.original for sample in data_handler],
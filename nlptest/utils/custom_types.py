@@ -52,6 +52,7 @@ class NERPrediction(BaseModel):
     class Config:
         extra = "ignore"
         allow_population_by_field_name = True
+        copy_on_model_validation = "none"
 
     @classmethod
     def from_span(
@@ -66,10 +67,10 @@ class NERPrediction(BaseModel):
             pos_tag: str = None,
             chunk_tag: str = None
     ) -> "NERPrediction":
-        """"""
-        return cls(
+        """Builds a prediction from already typed values, skipping pydantic validation."""
+        return cls.construct(
             entity=entity,
-            span=Span(start=start, end=end, word=word),
+            span=Span.construct(start=start, end=end, word=word),
             score=score,
             doc_id=doc_id,
             doc_name=doc_name,
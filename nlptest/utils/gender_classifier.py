@@ -1,9 +1,6 @@
 import logging
 import os
 
-import torch
-from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
-
 
 class GenderClassifier(object):
     """
@@ -15,6 +12,10 @@ class GenderClassifier(object):
 
     def __init__(self):
         """"""
+        #   imported here so that importing nlptest does not pull torch and transformers in
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
         logging.getLogger("transformers").setLevel(logging.ERROR)
 
         tokenizer = AutoTokenizer.from_pretrained(self.PRETRAINED_MODEL)
@@ -0,0 +1,194 @@
+import os
+import tempfile
+import unittest
+
+from nlptest.datahandler.datasource import ConllDataset, CSVDataset, DataFactory
+
+
+class CSVExportTestCase(unittest.TestCase):
+    """"""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.output_path = os.path.join(self.tmp_dir.name, "export.csv")
+
+    def test_export_ner(self):
+        """"""
+        samples = DataFactory("nlptest/data/conll/sample.conll", task="ner").load()[:5]
+        CSVDataset("tests/fixtures/text_classification.csv", task="ner").export_data(samples, self.output_path)
+
+        with open(self.output_path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines[0].startswith("-DOCSTART-"))
+
+        token_lines = [line for line in lines[1:] if line]
+        predictions = [prediction for sample in samples for prediction in sample.expected_results.predictions]
+        self.assertEqual(len(token_lines), len(predictions))
+        for line, prediction in zip(token_lines, predictions):
+            self.assertTrue(line.startswith(prediction.span.word + ","))
+            self.assertTrue(line.endswith("," + prediction.entity))
+
+    def test_export_text_classification(self):
+        """"""
+        samples = DataFactory("tests/fixtures/text_classification.csv", task="text-classification").load()[:5]
+        CSVDataset("tests/fixtures/text_classification.csv", task="text-classification").export_data(
+            samples, self.output_path)
+
+        with open(self.output_path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(
+            lines,
+            [f"{sample.original},{sample.expected_results.predictions[0].label}" for sample in samples]
+        )
+
+
+class CSVNERLoadTestCase(unittest.TestCase):
+    """"""
+
+    def test_load_ner(self):
+        """"""
+        samples = DataFactory("tests/fixtures/ner.csv", task="ner").load()
+        conll_samples = DataFactory("nlptest/data/conll/sample.conll", task="ner").load()[:len(samples)]
+
+        self.assertEqual(len(samples), 4)
+        for sample, conll_sample in zip(samples, conll_samples):
+            self.assertEqual(sample.original, conll_sample.original)
+            self.assertEqual(
+                [(p.entity, p.span.start, p.span.end, p.span.word, p.pos_tag, p.chunk_tag)
+                 for p in sample.expected_results.predictions],
+                [(p.entity, p.span.start, p.span.end, p.span.word, p.pos_tag, p.chunk_tag)
+                 for p in conll_sample.expected_results.predictions]
+            )
+
+    def test_load_ner_invalid_cells(self):
+        """"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "invalid.csv")
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write("text,ner_tags,pos_tags,chunk_tags\n")
+                f.write("EU rejects,B-ORG O,NNP VBZ,B-NP B-VP\n")
+
+            with self.assertRaises(AssertionError):
+                DataFactory(file_path, task="ner").load()
+
+    def test_load_ner_integer_tags(self):
+        """"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "integer_tags.csv")
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write("text,ner_tags,pos_tags,chunk_tags\n")
+                f.write('"[\'EU\', \'rejects\']","[3, 0]","[22, 42]","[11, 21]"\n')
+
+            predictions = DataFactory(file_path, task="ner").load()[0].expected_results.predictions
+        self.assertEqual([p.entity for p in predictions], ["3", "0"])
+        self.assertEqual([p.pos_tag for p in predictions], ["22", "42"])
+        self.assertEqual([p.chunk_tag for p in predictions], ["11", "21"])
+
+
+class CSVTextClassificationLoadTestCase(unittest.TestCase):
+    """"""
+
+    def load(self, content: str):
+        """"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "data.csv")
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            return DataFactory(file_path, task="text-classification").load()
+
+    def test_load_keeps_na_strings(self):
+        """"""
+        samples = self.load("text,label\nNA,neutral\nI love it,positive\n")
+        self.assertEqual([sample.original for sample in samples], ["NA", "I love it"])
+        self.assertEqual([sample.expected_results.predictions[0].label for sample in samples], ["neutral", "positive"])
+
+    def test_load_missing_label(self):
+        """"""
+        with self.assertRaises(ValueError):
+            self.load("text,label\nI love it,positive\nI hate it\n")
+
+
+class ConllLoadTestCase(unittest.TestCase):
+    """"""
+
+    DOCSTART = "-DOCSTART- -X- -X- O"
+
+    def load(self, content: str):
+        """"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "data.conll")
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            return DataFactory(file_path, task="ner").load()
+
+    @staticmethod
+    def spans(sample):
+        """"""
+        return [(p.span.word, p.span.start, p.span.end, p.entity) for p in sample.expected_results.predictions]
+
+    @staticmethod
+    def docs(sample):
+        """"""
+        return {(p.doc_id, p.doc_name) for p in sample.expected_results.predictions}
+
+    def test_starts_with_docstart(self):
+        """"""
+        samples = self.load(
+            f"{self.DOCSTART}\n\n"
+            "EU NNP B-NP B-ORG\nrejects VBZ B-VP O\n\n"
+            "Peter NNP B-NP B-PER\nBlackburn NNP I-NP I-PER\n"
+        )
+        self.assertEqual([sample.original for sample in samples], ["EU rejects", "Peter Blackburn"])
+        self.assertEqual(self.spans(samples[0]), [("EU", 0, 2, "B-ORG"), ("rejects", 3, 10, "O")])
+        self.assertEqual(self.spans(samples[1]), [("Peter", 0, 5, "B-PER"), ("Blackburn", 6, 15, "I-PER")])
+        for sample in samples:
+            self.assertEqual(self.docs(sample), {(0, self.DOCSTART)})
+        self.assertEqual(samples[0].expected_results.predictions[0].pos_tag, "NNP")
+        self.assertEqual(samples[0].expected_results.predictions[0].chunk_tag, "B-NP")
+
+    def test_consecutive_docstarts(self):
+        """"""
+        samples = self.load(
+            f"{self.DOCSTART}\n{self.DOCSTART}\n\n"
+            "EU NNP B-NP B-ORG\n\n"
+            f"{self.DOCSTART}\n\n"
+            "Peter NNP B-NP B-PER\n"
+        )
+        self.assertEqual([sample.original for sample in samples], ["EU", "Peter"])
+        self.assertEqual(self.docs(samples[0]), {(1, self.DOCSTART)})
+        self.assertEqual(self.docs(samples[1]), {(2, self.DOCSTART)})
+
+    def test_runs_of_blank_lines(self):
+        """"""
+        samples = self.load(
+            "\n\nEU NNP B-NP B-ORG\nrejects VBZ B-VP O\n\n\n\n"
+            f"{self.DOCSTART}\n\n\n"
+            "Peter NNP B-NP B-PER\n\n\n"
+        )
+        self.assertEqual([sample.original for sample in samples], ["EU rejects", "Peter"])
+        self.assertEqual(self.docs(samples[0]), {(0, "")})
+        self.assertEqual(self.docs(samples[1]), {(1, self.DOCSTART)})
+        self.assertEqual(self.spans(samples[1]), [("Peter", 0, 5, "B-PER")])
+
+    def test_export_keeps_docstart_after_preamble(self):
+        """"""
+        samples = self.load(
+            "EU NNP B-NP B-ORG\n\n"
+            f"{self.DOCSTART}\n\n"
+            "Peter NNP B-NP B-PER\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "export.conll")
+            ConllDataset(output_path, task="ner").export_data(samples, output_path)
+            with open(output_path, encoding="utf-8") as f:
+                exported = f.read()
+        self.assertEqual(exported.count(self.DOCSTART), 1)
+        self.assertIn(f"{self.DOCSTART}\n\nPeter NNP B-NP B-PER\n", exported)
+
+    def test_no_trailing_newline(self):
+        """"""
+        samples = self.load(f"{self.DOCSTART}\n\nEU NNP B-NP B-ORG\nrejects VBZ B-VP O")
+        self.assertEqual(len(samples), 1)
+        self.assertEqual(self.spans(samples[0]), [("EU", 0, 2, "B-ORG"), ("rejects", 3, 10, "O")])
+        self.assertEqual(self.docs(samples[0]), {(0, self.DOCSTART)})
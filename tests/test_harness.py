@@ -1,5 +1,9 @@
 import os
+import threading
+import time
 import unittest
+from unittest import mock
+
 from nlptest import Harness
 from nlptest.utils.custom_types import Sample
 from nlptest.modelhandler.modelhandler import ModelFactory
@@ -158,3 +162,32 @@ class DefaultCodeBlocksTestCase(unittest.TestCase):
             h.generate().run().report()
         except Exception as e:
             self.fail(f"Test failed with the following error:\n{e}")
+
+
+class HarnessLoadingTestCase(unittest.TestCase):
+
+    def test_invalid_data_does_not_wait_for_model(self):
+        """"""
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_load_model(**kwargs):
+            loading.set()
+            release.wait(timeout=30)
+            raise RuntimeError("model should not be needed")
+
+        with mock.patch.object(ModelFactory, "load_model", side_effect=slow_load_model):
+            start = time.monotonic()
+            with self.assertRaises(OSError):
+                Harness(
+                    task="ner",
+                    model="dslim/bert-base-NER",
+                    data="tests/fixtures/text_classification.csv",
+                    hub="huggingface"
+                )
+            elapsed = time.monotonic() - start
+            #   the model was being loaded while the data failed to parse
+            self.assertTrue(loading.wait(timeout=5))
+            release.set()
+
+        self.assertLess(elapsed, 10)
@@ -1,5 +1,13 @@
+import importlib
+import os
+import sys
+import tempfile
+import types
 import unittest
+from unittest import mock
+
 from nlptest.modelhandler import ModelFactory
+from nlptest.modelhandler import transformers_modelhandler
 
 
 class HuggingFaceTestCase(unittest.TestCase):
@@ -21,3 +29,136 @@ class HuggingFaceTestCase(unittest.TestCase):
         # Raises with unsupported task to model Factory
         with self.assertRaises(AssertionError):
             ModelFactory(self.models[0], self.tasks[1])
+
+    def test_prediction_cache(self):
+        model = ModelFactory.load_model(task=self.tasks[0], hub="huggingface", path=self.models[0])
+        text = "I live in London, United Kingdom since 2019"
+        first = model.predict(text)
+        batch = model.predict([text, text])
+        self.assertEqual(len(model._cache), 1)
+        self.assertEqual(len(batch), 2)
+        self.assertIsNot(first, batch[0])
+        self.assertEqual(first.predictions, batch[0].predictions)
+        model.cache_clear()
+        self.assertEqual(len(model._cache), 0)
+
+    def test_prediction_cache_size(self):
+        loaded = ModelFactory.load_model(task=self.tasks[0], hub="huggingface", path=self.models[0])
+        model = ModelFactory(loaded.model_class.model, self.tasks[0], cache_size=1)
+        first = model.predict("I live in London")
+        first.predictions[0].span.shift(5)
+        self.assertNotEqual(model.predict("I live in London").predictions, first.predictions)
+        model.predict("I work in Paris")
+        self.assertEqual(len(model._cache), 1)
+        self.assertIn(("I work in Paris", frozenset()), model._cache)
+
+    def test_model_cache(self):
+        model = ModelFactory.load_model(task=self.tasks[0], hub="huggingface", path=self.models[0])
+        other = ModelFactory.load_model(task=self.tasks[0], hub="huggingface", path=self.models[0])
+        self.assertIs(model.model_class.model, other.model_class.model)
+        ModelFactory.clear_model_cache()
+        reloaded = ModelFactory.load_model(task=self.tasks[0], hub="huggingface", path=self.models[0])
+        self.assertIsNot(model.model_class.model, reloaded.model_class.model)
+
+
+class HuggingFacePredictBatchTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.texts = ["I live in London, United Kingdom since 2019", "", "Peter Blackburn works for the EU"]
+
+    def test_ner_predict_batch(self):
+        handler_class = transformers_modelhandler.PretrainedModelForNER
+        handler = handler_class(handler_class.load_model("dslim/bert-base-NER"))
+        for texts in (self.texts, self.texts[:1], [""]):
+            self.assertEqual(
+                [output.predictions for output in handler.predict_batch(texts)],
+                [handler.predict(text).predictions for text in texts]
+            )
+
+    def test_text_classification_predict_batch(self):
+        handler_class = transformers_modelhandler.PretrainedModelForTextClassification
+        handler = handler_class(handler_class.load_model("mrm8488/distilroberta-finetuned-tweets-hate-speech"))
+        for texts in (self.texts, self.texts[:1], [""]):
+            batch = [output.predictions for output in handler.predict_batch(texts)]
+            single = [handler.predict(text).predictions for text in texts]
+            self.assertEqual([[p.label for p in labels] for labels in batch],
+                             [[p.label for p in labels] for labels in single])
+            # padding within a batch can change scores by rounding errors only
+            for batch_labels, single_labels in zip(batch, single):
+                for batch_label, single_label in zip(batch_labels, single_labels):
+                    self.assertAlmostEqual(batch_label.score, single_label.score, places=4)
+
+
+class ONNXRuntimeTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.model_path = "dslim/bert-base-NER"
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.save_dir = os.path.join(self.cache_dir.name, "dslim--bert-base-NER")
+
+        onnxruntime = types.ModuleType("optimum.onnxruntime")
+        onnxruntime.ORTModelForTokenClassification = mock.MagicMock()
+        onnxruntime.ORTModelForSequenceClassification = mock.MagicMock()
+        onnxruntime.ORTQuantizer = mock.MagicMock()
+        configuration = types.ModuleType("optimum.onnxruntime.configuration")
+        configuration.AutoQuantizationConfig = mock.MagicMock()
+        pipelines = types.ModuleType("optimum.pipelines")
+        pipelines.pipeline = mock.MagicMock()
+        self.onnxruntime, self.pipelines = onnxruntime, pipelines
+
+        real_find_spec = importlib.util.find_spec
+        patches = [
+            mock.patch.dict(sys.modules, {
+                "optimum": types.ModuleType("optimum"),
+                "optimum.onnxruntime": onnxruntime,
+                "optimum.onnxruntime.configuration": configuration,
+                "optimum.pipelines": pipelines,
+            }),
+            mock.patch("importlib.util.find_spec",
+                       side_effect=lambda name, *args: mock.MagicMock() if name == "optimum"
+                       else real_find_spec(name, *args)),
+            mock.patch("transformers.AutoTokenizer"),
+            mock.patch.object(transformers_modelhandler, "ONNX_CACHE_DIR", self.cache_dir.name),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def test_missing_optimum(self):
+        with mock.patch("importlib.util.find_spec", return_value=None):
+            with self.assertRaises(ModuleNotFoundError):
+                transformers_modelhandler.PretrainedModelForNER.load_model(self.model_path, accelerator="ort")
+
+    def test_unknown_accelerator(self):
+        with self.assertRaises(ValueError):
+            transformers_modelhandler.PretrainedModelForNER.load_model(self.model_path, accelerator="tensorrt")
+        with self.assertRaises(ValueError):
+            transformers_modelhandler.PretrainedModelForTextClassification.load_model(
+                self.model_path, accelerator="tensorrt")
+
+    def test_task_names(self):
+        transformers_modelhandler.PretrainedModelForNER.load_model(self.model_path, accelerator="ort")
+        self.assertEqual(self.pipelines.pipeline.call_args[1]["task"], "token-classification")
+        self.assertEqual(self.pipelines.pipeline.call_args[1]["accelerator"], "ort")
+        self.onnxruntime.ORTModelForTokenClassification.from_pretrained.assert_called_once_with(
+            self.model_path, export=True)
+
+        transformers_modelhandler.PretrainedModelForTextClassification.load_model(self.model_path, accelerator="ort")
+        self.assertEqual(self.pipelines.pipeline.call_args[1]["task"], "text-classification")
+        self.onnxruntime.ORTModelForSequenceClassification.from_pretrained.assert_called_once_with(
+            self.model_path, export=True)
+
+    def test_exported_model_is_reused(self):
+        os.makedirs(self.save_dir)
+        for file_name in ("model.onnx", "model_quantized.onnx"):
+            open(os.path.join(self.save_dir, file_name), "w").close()
+
+        transformers_modelhandler.PretrainedModelForNER.load_model(self.model_path, accelerator="ort", quantize=True)
+        from_pretrained = self.onnxruntime.ORTModelForTokenClassification.from_pretrained
+        self.assertEqual(
+            from_pretrained.call_args_list,
+            [mock.call(self.save_dir, file_name="model.onnx"),
+             mock.call(self.save_dir, file_name="model_quantized.onnx")]
+        )
+        self.onnxruntime.ORTQuantizer.from_pretrained.assert_not_called()
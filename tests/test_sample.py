@@ -641,3 +641,10 @@ class TokenMismatch(unittest.TestCase):
             ]
         )
         self.assertTrue(sample.is_pass())
+
+    def test_from_span_matches_validated_prediction(self):
+        """"""
+        prediction = NERPrediction.from_span(entity="PROD", word="KFC", start=10, end=13, pos_tag="NNP")
+        validated = NERPrediction(entity="PROD", span=Span(start=10, end=13, word="KFC"), pos_tag="NNP")
+        self.assertEqual(prediction.dict(), validated.dict())
+        self.assertEqual(repr(prediction), repr(validated))
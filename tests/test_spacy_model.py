@@ -1,5 +1,8 @@
 
 import unittest
+
+from pkg_resources import resource_filename
+
 from nlptest import Harness
 from nlptest.modelhandler.modelhandler import ModelFactory
 
@@ -46,3 +49,43 @@ class SpacyTestCase(unittest.TestCase):
             harness.run(),
             Harness
         )
+
+
+class SpacyNERHandlerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.model = ModelFactory.load_model(task="ner", hub="spacy", path="en_core_web_sm")
+        self.text = "Peter Blackburn flew from New York to London on Monday ."
+
+    def test_predict_raw(self):
+        doc = self.model.model_class.model(self.text)
+        expected = [f"{t.ent_iob_}-{t.ent_type_}" if t.ent_type_ else t.ent_iob_ for t in doc]
+        self.assertIn("O", expected)
+        self.assertEqual(self.model.predict_raw(self.text), expected)
+
+    def test_predict_batch(self):
+        handler = self.model.model_class
+        for texts in ([self.text, "", "EU rejects German call"], [self.text], [""]):
+            self.assertEqual(
+                [output.predictions for output in handler.predict_batch(texts)],
+                [handler.predict(text).predictions for text in texts]
+            )
+
+
+class SpacyTextClassificationHandlerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        path = resource_filename("nlptest", "data/textcat_imdb")
+        self.model = ModelFactory.load_model(task="text-classification", hub="spacy", path=path)
+
+    def test_predict_batch(self):
+        handler = self.model.model_class
+        texts = ["This movie was a delight from start to finish.", "", "Dull and far too long."]
+        for batch in (texts, texts[:1], [""]):
+            outputs = handler.predict_batch(batch)
+            self.assertEqual(len(outputs), len(batch))
+            for output, text in zip(outputs, batch):
+                expected = handler.predict(text).predictions
+                self.assertEqual([label.label for label in output.predictions], [label.label for label in expected])
+                for label, expected_label in zip(output.predictions, expected):
+                    self.assertAlmostEqual(label.score, expected_label.score, places=4)
@@ -0,0 +1,77 @@
+import unittest
+
+from nlptest import testrunner
+from nlptest.utils.custom_types import NEROutput, NERPrediction
+
+
+class StubModelHandler:
+    """Records the batches it receives and predicts the whole text as a single entity."""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts, batch_size=None):
+        self.batches.append(list(texts))
+        return [
+            NEROutput(predictions=[NERPrediction.from_span(entity="MISC", word=text, start=0, end=len(text))])
+            for text in texts
+        ]
+
+
+class TestRunnerBatchingTestCase(unittest.TestCase):
+    """"""
+
+    def setUp(self) -> None:
+        self.handler = StubModelHandler()
+        self.texts = ["a" * 40, "b" * 4, "c" * 120, "d" * 12, "e" * 80, "f" * 1, "g" * 60]
+
+    def runner(self, batch_size=32, max_tokens_per_batch=None) -> testrunner.TestRunner:
+        """"""
+        return testrunner.TestRunner([], self.handler, [], batch_size, max_tokens_per_batch)
+
+    def test_predictions_in_input_order(self):
+        """"""
+        predictions = self.runner(batch_size=2)._predict(self.texts)
+        self.assertEqual([prediction[0].span.word for prediction in predictions], self.texts)
+        self.assertEqual(self.handler.batches[0], ["f" * 1, "b" * 4])
+
+    def test_batch_size_without_budget(self):
+        """"""
+        batches = self.runner(batch_size=3)._make_batches(self.texts)
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+        self.assertEqual(sorted(i for batch in batches for i in batch), list(range(len(self.texts))))
+        lengths = [len(self.texts[i]) for batch in batches for i in batch]
+        self.assertEqual(lengths, sorted(lengths))
+
+    def test_token_budget(self):
+        """"""
+        max_tokens = 40
+        batches = self.runner(batch_size=1, max_tokens_per_batch=max_tokens)._make_batches(self.texts)
+        self.assertEqual(sorted(i for batch in batches for i in batch), list(range(len(self.texts))))
+        for batch in batches:
+            longest = max(testrunner.TestRunner._estimate_tokens(self.texts[i]) for i in batch)
+            if len(batch) > 1:
+                self.assertLessEqual(len(batch) * longest, max_tokens)
+        #   the budget, not batch_size, decides how many texts go together
+        self.assertGreater(len(batches[0]), 1)
+
+    def test_text_over_budget_gets_own_batch(self):
+        """"""
+        batches = self.runner(max_tokens_per_batch=10)._make_batches(["short", "x" * 400])
+        self.assertEqual(batches, [[0], [1]])
+
+    def test_duplicates_predicted_once(self):
+        """"""
+        texts = ["I live in London", "Peter lives in Paris", "I live in London", "I live in London"]
+        predictions = self.runner()._predict(texts)
+
+        seen = [text for batch in self.handler.batches for text in batch]
+        self.assertEqual(sorted(seen), sorted(set(texts)))
+        self.assertIsNot(predictions[0], predictions[2])
+        self.assertIsNot(predictions[2], predictions[3])
+        self.assertIsNot(predictions[0].predictions[0].span, predictions[3].predictions[0].span)
+
+        #   realignment shifts spans in place, it must not leak into the other samples
+        predictions[0].predictions[0].span.shift(3)
+        self.assertEqual(predictions[2].predictions[0].span.start, 0)
+        self.assertEqual(predictions[3].predictions[0].span.start, 0)